@@ -6,11 +6,27 @@ including interventions, locations, enrollment, outcomes, and aggregated
 summary statistics (phase distribution, sponsor breakdown, year timeline).
 """
 
+import asyncio
 import logging
+import time
 from collections import Counter
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
+import orjson
+
+from .constants import (
+    EMPTY_MAPPING,
+    TRIALS_CACHE_SIZE_LIMIT,
+    TRIALS_CACHE_TTL,
+    TRIALS_EMPTY_CACHE_MAX_SIZE,
+)
+
+# Persistent trial cache is optional; without diskcache every search goes to the API
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
 
 logger = logging.getLogger(__name__)
 
@@ -82,9 +98,24 @@ STATUS_DISPLAY = {
 class ClinicalTrialsClient:
     """Async client for ClinicalTrials.gov v2 API with fallback data."""
 
-    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+    def __init__(
+        self,
+        client: Optional[httpx.AsyncClient] = None,
+        cache_dir: Optional[str] = None,
+    ):
         self._external = client is not None
         self.client = client or httpx.AsyncClient(timeout=15.0)
+        # Live search results persisted across restarts, keyed by normalised query
+        self._cache = (
+            diskcache.Cache(cache_dir, size_limit=TRIALS_CACHE_SIZE_LIMIT)
+            if cache_dir and diskcache is not None
+            else None
+        )
+        # Live searches currently in flight, so identical concurrent queries share one request
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # Queries the API answered with zero trials: key -> expiry (monotonic). Kept in memory
+        # so the common "no competition" answer needs neither the network nor the disk cache.
+        self._known_empty: Dict[str, float] = {}
 
     # ------------------------------------------------------------------
     # Public API
@@ -98,6 +129,33 @@ class ClinicalTrialsClient:
         page_size: int = 50,
     ) -> Dict[str, Any]:
         """Search ClinicalTrials.gov and return trials + summary stats."""
+        cache_key = self._cache_key(gene, disease, status, phase, page_size)
+        return await self._search(
+            gene, disease, status, phase, page_size, cache_key, self._lookup(cache_key)
+        )
+
+    async def search_trials_uncached(
+        self,
+        gene: str,
+        disease: str = "cancer",
+        status: str = "ALL",
+        phase: str = "ALL",
+        page_size: int = 50,
+    ) -> Dict[str, Any]:
+        """search_trials for callers that just missed cached_search: skips the second cache read."""
+        cache_key = self._cache_key(gene, disease, status, phase, page_size)
+        return await self._search(gene, disease, status, phase, page_size, cache_key, None)
+
+    async def _search(
+        self,
+        gene: str,
+        disease: str,
+        status: str,
+        phase: str,
+        page_size: int,
+        cache_key: str,
+        cached: Optional[Tuple[List[Dict[str, Any]], int]],
+    ) -> Dict[str, Any]:
         params: Dict[str, Any] = {
             "format": "json",
             "countTotal": "true",
@@ -124,11 +182,15 @@ class ClinicalTrialsClient:
         source = "live"
 
         try:
-            resp = await self.client.get(CT_BASE_URL, params=params)
-            resp.raise_for_status()
-            data = resp.json()
-            total_count = data.get("totalCount", 0)
-            trials = [self._parse_study(s) for s in data.get("studies", [])]
+            if cached is not None:
+                trials, total_count = cached
+            else:
+                fut = self._inflight.get(cache_key)
+                if fut is None:
+                    fut = asyncio.ensure_future(self._fetch_live(cache_key, params))
+                    self._inflight[cache_key] = fut
+                    fut.add_done_callback(lambda _f: self._inflight.pop(cache_key, None))
+                trials, total_count = await asyncio.shield(fut)
         except Exception as exc:
             logger.warning("ClinicalTrials.gov API error: %s", exc)
             fb = self._get_fallback(gene, disease)
@@ -137,8 +199,50 @@ class ClinicalTrialsClient:
                 total_count = len(fb)
                 source = "fallback"
 
-        summary = self._compute_summary(trials, total_count)
+        return self._build_result(gene, disease, status, phase, trials, total_count, source)
 
+    def cached_search(
+        self,
+        gene: str,
+        disease: str = "cancer",
+        status: str = "ALL",
+        phase: str = "ALL",
+        page_size: int = 50,
+    ) -> Optional[Dict[str, Any]]:
+        """Return the search_trials result from cache without awaiting, or None on a miss."""
+        cached = self._lookup(self._cache_key(gene, disease, status, phase, page_size))
+        if cached is None:
+            return None
+        trials, total_count = cached
+        return self._build_result(gene, disease, status, phase, trials, total_count, "live")
+
+    # ------------------------------------------------------------------
+    # Caching helpers
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _cache_key(gene: str, disease: str, status: str, phase: str, page_size: int) -> str:
+        return f"{gene.upper()}|{disease.lower()}|{status.upper()}|{phase.upper()}|{min(page_size, 100)}"
+
+    def _lookup(self, cache_key: str) -> Optional[Tuple[List[Dict[str, Any]], int]]:
+        expires = self._known_empty.get(cache_key)
+        if expires is not None:
+            if expires > time.monotonic():
+                return [], 0
+            del self._known_empty[cache_key]
+        if self._cache is not None:
+            return self._cache.get(cache_key)
+        return None
+
+    def _build_result(
+        self,
+        gene: str,
+        disease: str,
+        status: str,
+        phase: str,
+        trials: List[Dict[str, Any]],
+        total_count: int,
+        source: str,
+    ) -> Dict[str, Any]:
         return {
             "query": {
                 "gene": gene,
@@ -146,26 +250,42 @@ class ClinicalTrialsClient:
                 "status_filter": status,
                 "phase_filter": phase,
             },
-            "summary": summary,
+            "summary": self._compute_summary(trials, total_count),
             "trials": trials,
             "source": source,
         }
 
+    async def _fetch_live(
+        self, cache_key: str, params: Dict[str, Any]
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        resp = await self.client.get(CT_BASE_URL, params=params)
+        resp.raise_for_status()
+        data = orjson.loads(resp.content)
+        total_count = data.get("totalCount", 0)
+        trials = [self._parse_study(s) for s in data.get("studies", [])]
+        if not trials and not total_count:
+            if len(self._known_empty) >= TRIALS_EMPTY_CACHE_MAX_SIZE:
+                self._known_empty.pop(next(iter(self._known_empty)))
+            self._known_empty[cache_key] = time.monotonic() + TRIALS_CACHE_TTL
+        elif self._cache is not None:
+            self._cache.set(cache_key, (trials, total_count), expire=TRIALS_CACHE_TTL)
+        return trials, total_count
+
     # ------------------------------------------------------------------
     # Parsing helpers
     # ------------------------------------------------------------------
     @staticmethod
     def _parse_study(s: Dict) -> Dict[str, Any]:
-        proto = s.get("protocolSection", {})
-        ident = proto.get("identificationModule", {})
-        status_mod = proto.get("statusModule", {})
-        design = proto.get("designModule", {})
-        sponsor_mod = proto.get("sponsorCollaboratorsModule", {})
-        desc = proto.get("descriptionModule", {})
-        cond_mod = proto.get("conditionsModule", {})
-        arms = proto.get("armsInterventionsModule", {})
-        outcomes = proto.get("outcomesModule", {})
-        contacts = proto.get("contactsLocationsModule", {})
+        proto = s.get("protocolSection") or EMPTY_MAPPING
+        ident = proto.get("identificationModule") or EMPTY_MAPPING
+        status_mod = proto.get("statusModule") or EMPTY_MAPPING
+        design = proto.get("designModule") or EMPTY_MAPPING
+        sponsor_mod = proto.get("sponsorCollaboratorsModule") or EMPTY_MAPPING
+        desc = proto.get("descriptionModule") or EMPTY_MAPPING
+        cond_mod = proto.get("conditionsModule") or EMPTY_MAPPING
+        arms = proto.get("armsInterventionsModule") or EMPTY_MAPPING
+        outcomes = proto.get("outcomesModule") or EMPTY_MAPPING
+        contacts = proto.get("contactsLocationsModule") or EMPTY_MAPPING
 
         nct_id = ident.get("nctId", "")
 
@@ -176,7 +296,7 @@ class ClinicalTrialsClient:
         status_raw = status_mod.get("overallStatus", "")
         status = STATUS_DISPLAY.get(status_raw, status_raw)
 
-        enrollment_info = design.get("enrollmentInfo", {})
+        enrollment_info = design.get("enrollmentInfo") or EMPTY_MAPPING
 
         interventions_raw = arms.get("interventions", [])
         interventions = [
@@ -207,10 +327,12 @@ class ClinicalTrialsClient:
             "official_title": ident.get("officialTitle", ""),
             "status": status,
             "phase": phase,
-            "sponsor": sponsor_mod.get("leadSponsor", {}).get("name", ""),
-            "start_date": (status_mod.get("startDateStruct") or {}).get("date", ""),
+            "sponsor": (sponsor_mod.get("leadSponsor") or EMPTY_MAPPING).get("name", ""),
+            "start_date": (
+                status_mod.get("startDateStruct") or EMPTY_MAPPING
+            ).get("date", ""),
             "completion_date": (
-                status_mod.get("primaryCompletionDateStruct") or {}
+                status_mod.get("primaryCompletionDateStruct") or EMPTY_MAPPING
             ).get("date", ""),
             "enrollment": enrollment_info.get("count", 0) or 0,
             "conditions": cond_mod.get("conditions", []),
@@ -1,19 +1,42 @@
 """Named constants extracted from magic numbers across the codebase."""
 
+from types import MappingProxyType
+
+# --- Shared ---
+EMPTY_MAPPING = MappingProxyType({})  # read-only default for missing nested sections (no fresh {} per lookup)
+
 # --- Cache ---
 EXTRACTION_CACHE_MAX_SIZE = 500
 EXTRACTION_CACHE_TTL = 1800.0  # 30 minutes
 SEMANTIC_CACHE_MAX_SIZE = 1000
 SEMANTIC_SIMILARITY_THRESHOLD = 0.8
+SEMANTIC_FUZZY_MEMO_SIZE = 1024
+VALIDATION_CACHE_MAX_SIZE = 2048
+VALIDATION_CACHE_FRESH_TTL = 86400.0  # 24 hours
+VALIDATION_CACHE_STALE_TTL = 604800.0  # 7 days
+TRIALS_CACHE_TTL = 86400  # 24 hours
+TRIALS_CACHE_SIZE_LIMIT = 2**30  # 1 GiB on disk
+TRIALS_EMPTY_CACHE_MAX_SIZE = 10000
+
+# --- LLM ---
+LLM_MAX_CONCURRENCY = 10  # in-flight provider calls per process (env: LLM_MAX_CONCURRENCY)
 
 # --- Entity Extraction ---
 DEFAULT_ENTITY_THRESHOLD = 0.4
 
 # --- HTTP ---
 DEFAULT_HTTP_TIMEOUT = 60.0
+HTTP_MAX_RETRIES = 3
+HTTP_RETRY_BACKOFF_BASE = 0.5  # seconds, doubled per attempt with jitter
+HTTP_RETRYABLE_STATUS = frozenset({429, 502, 503, 504})
+HTTP_CONNECT_TIMEOUT = 5.0
+HTTP_MAX_CONNECTIONS = 100
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 50
+HTTP_KEEPALIVE_EXPIRY = 30.0  # seconds
 
 # --- Knowledge Graph ---
 SPRING_LAYOUT_ITERATIONS = 80
+LAYOUT_CACHE_MAX_SIZE = 8  # layouts kept per builder (one per graph shape / canvas size)
 MAX_HYPOTHESES = 5
 ACTIVATION_GLOW_THRESHOLD = 0.5
 MAX_NODE_RADIUS = 42
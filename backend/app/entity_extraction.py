@@ -13,6 +13,7 @@ Features:
 """
 
 import hashlib
+import heapq
 import threading
 from typing import Dict, List, Any, Optional, Tuple
 from collections import OrderedDict
@@ -97,14 +98,27 @@ class ExtractionCache:
         self._lock = threading.Lock()
         self.hits = 0
         self.misses = 0
+        # Min-heap of (expires_at, key) so expired entries are dropped without scanning the cache
+        self._expiry_heap: List[Tuple[float, str]] = []
 
     def _make_key(self, text: str, mode: str) -> str:
         normalized = text.strip().lower()
         return f"{mode}:{hashlib.sha256(normalized.encode()).hexdigest()}"
 
+    def _purge_expired(self, now: float):
+        """Drop entries whose expiry has passed. Caller must hold the lock."""
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            _, key = heapq.heappop(heap)
+            entry = self.cache.get(key)
+            # Skip heap items made stale by a later set() of the same key
+            if entry is not None and entry.is_expired:
+                del self.cache[key]
+
     def get(self, text: str, mode: str) -> Optional[Dict[str, Any]]:
         key = self._make_key(text, mode)
         with self._lock:
+            self._purge_expired(time.time())
             if key in self.cache:
                 entry = self.cache[key]
                 if not entry.is_expired:
@@ -119,10 +133,20 @@ class ExtractionCache:
     def set(self, text: str, mode: str, result: Dict[str, Any]):
         key = self._make_key(text, mode)
         with self._lock:
-            self.cache[key] = ExtractionCacheEntry(result=result, timestamp=time.time())
+            now = time.time()
+            self._purge_expired(now)
+            entry = ExtractionCacheEntry(result=result, timestamp=now)
+            self.cache[key] = entry
             self.cache.move_to_end(key)
+            heapq.heappush(self._expiry_heap, (now + entry.ttl, key))
             while len(self.cache) > self.max_size:
                 self.cache.popitem(last=False)
+            # Re-set and evicted keys leave stale heap items behind; rebuild from live entries
+            if len(self._expiry_heap) > 2 * self.max_size:
+                self._expiry_heap = [
+                    (e.timestamp + e.ttl, k) for k, e in self.cache.items()
+                ]
+                heapq.heapify(self._expiry_heap)
 
     def stats(self) -> Dict[str, Any]:
         total = self.hits + self.misses
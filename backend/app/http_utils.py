@@ -0,0 +1,39 @@
+"""
+Shared HTTP helpers for the agents that call external APIs.
+"""
+
+import asyncio
+import logging
+import random
+from typing import Any
+
+import httpx
+
+from .constants import (
+    HTTP_MAX_RETRIES,
+    HTTP_RETRY_BACKOFF_BASE,
+    HTTP_RETRYABLE_STATUS,
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def request_with_retry(
+    client: httpx.AsyncClient,
+    method: str,
+    url: str,
+    max_retries: int = HTTP_MAX_RETRIES,
+    **kwargs: Any,
+) -> httpx.Response:
+    """
+    Send METHOD URL, retrying rate-limited / transient 5xx responses with jittered exponential backoff.
+    Anything else (400/401/403/404...) is returned at once; the last response is returned when retries run out.
+    """
+    for attempt in range(max_retries + 1):
+        resp = await client.request(method, url, **kwargs)
+        if resp.status_code not in HTTP_RETRYABLE_STATUS or attempt == max_retries:
+            return resp
+        delay = HTTP_RETRY_BACKOFF_BASE * 2 ** attempt * random.uniform(0.5, 1.5)
+        logger.info("%s returned %s, retrying in %.1fs", url, resp.status_code, delay)
+        await asyncio.sleep(delay)
+    return resp
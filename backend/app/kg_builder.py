@@ -14,24 +14,58 @@ Also merges OpenTargets API associations into the same graph so the
 frontend renders a single, unified, richly-styled KG.
 """
 
-import json
 import networkx as nx
+import orjson
 import math
+import sys
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 
+from .constants import LAYOUT_CACHE_MAX_SIZE
+
 _DATA_DIR = Path(__file__).parent / "data"
 
 def _load_pathway_data() -> Dict[str, Any]:
     path = _DATA_DIR / "pathways.json"
     if path.exists():
-        with open(path) as f:
-            return json.load(f)
+        return orjson.loads(path.read_bytes())
     return {"gene_pathways": {}, "gene_cell_types": {}, "signaling_cascades": {}}
 
 _PATHWAY_DATA = _load_pathway_data()
 
+
+def intern_id(value: Any) -> Any:
+    """Intern str node ids so repeated dict lookups hit CPython's identity fast path."""
+    return sys.intern(value) if type(value) is str else value
+
+
+_GENE_PATHWAYS: Dict[str, List[str]] = {
+    intern_id(g): v for g, v in _PATHWAY_DATA.get("gene_pathways", {}).items()
+}
+_GENE_CELL_TYPES: Dict[str, List[str]] = {
+    intern_id(g): v for g, v in _PATHWAY_DATA.get("gene_cell_types", {}).items()
+}
+
+
+def _index_cascade(steps: List[List[str]]) -> Tuple[Tuple[str, str, str], ...]:
+    """(partner, relation label, edge colour) per step; inhibitory labels are classified once here."""
+    return tuple(
+        (
+            intern_id(partner),
+            rel_label,
+            "#ef4444" if "inhibit" in rel_label.lower() or "repress" in rel_label.lower() else "#22c55e",
+        )
+        for partner, rel_label in steps
+    )
+
+
+# seed gene -> (upstream steps, downstream steps), pre-classified at import
+_SIGNALING_INDEX: Dict[str, Tuple[Tuple, Tuple]] = {
+    intern_id(gene): (_index_cascade(sig.get("upstream", [])), _index_cascade(sig.get("downstream", [])))
+    for gene, sig in _PATHWAY_DATA.get("signaling_cascades", {}).items()
+}
+
 # ---------------------------------------------------------------------------
 # Visual style constants
 # ---------------------------------------------------------------------------
@@ -124,12 +158,28 @@ def _normalise_type(raw: str) -> str:
     return mapping.get(raw, raw.lower().replace(" ", "_"))
 
 
+def _dict_entity_text(item: dict) -> str:
+    # Only stringify the whole dict when "text" is missing
+    return item["text"] if "text" in item else str(item)
+
+
+# Exact-type dispatch for the GLiNER2 shapes seen on the ingestion path;
+# subclasses fall through to the isinstance checks in entity_text.
+_ENTITY_TEXT_BY_TYPE = {
+    str: lambda item: item,
+    dict: _dict_entity_text,
+}
+
+
 def entity_text(item: Any) -> str:
     """Extract text string from various GLiNER2 output formats."""
+    extract = _ENTITY_TEXT_BY_TYPE.get(type(item))
+    if extract is not None:
+        return extract(item)
     if isinstance(item, str):
         return item
     if isinstance(item, dict):
-        return item.get("text", str(item))
+        return _dict_entity_text(item)
     return str(item)
 
 
@@ -154,6 +204,8 @@ class KnowledgeGraphBuilder:
 
     def __init__(self):
         self.graph = nx.DiGraph()
+        # (node set, edge set, width, height, padding) -> scaled positions
+        self._layout_cache: Dict[Tuple, Dict[str, Tuple[float, float]]] = {}
 
     # ------------------------------------------------------------------
     # Ingest GLiNER2 entities
@@ -176,7 +228,7 @@ class KnowledgeGraphBuilder:
             for item in items:
                 text = entity_text(item)
                 conf = _entity_confidence(item)
-                node_id = text  # use raw text as node id
+                node_id = intern_id(text)  # use raw text as node id
 
                 if self.graph.has_node(node_id):
                     # merge: keep highest confidence
@@ -218,6 +270,7 @@ class KnowledgeGraphBuilder:
                 head, tail, h_conf, t_conf = self._parse_relation_item(item)
                 if not head or not tail:
                     continue
+                head, tail = intern_id(head), intern_id(tail)
 
                 avg_conf = (h_conf + t_conf) / 2.0
 
@@ -305,13 +358,8 @@ class KnowledgeGraphBuilder:
         effectors for the seed gene. Provides directional signaling context
         for the Pathway view.
         """
-        pathways = _PATHWAY_DATA.get("gene_pathways", {})
-        cell_types = _PATHWAY_DATA.get("gene_cell_types", {})
-
-        signaling = _PATHWAY_DATA.get("signaling_cascades", {})
-
         # --- Add pathway nodes/edges ---
-        for p_name in pathways.get(seed_gene, []):
+        for p_name in _GENE_PATHWAYS.get(seed_gene, ()):
             if not self.graph.has_node(p_name):
                 self.graph.add_node(
                     p_name,
@@ -334,7 +382,7 @@ class KnowledgeGraphBuilder:
                 )
 
         # --- Add cell type nodes/edges ---
-        for c_name in cell_types.get(seed_gene, []):
+        for c_name in _GENE_CELL_TYPES.get(seed_gene, ()):
             if not self.graph.has_node(c_name):
                 self.graph.add_node(
                     c_name,
@@ -357,9 +405,9 @@ class KnowledgeGraphBuilder:
                 )
 
         # --- Add upstream/downstream signaling nodes/edges ---
-        sig = signaling.get(seed_gene, {})
+        upstream, downstream = _SIGNALING_INDEX.get(seed_gene, ((), ()))
 
-        for activator, rel_label in sig.get("upstream", []):
+        for activator, rel_label, edge_color in upstream:
             if not self.graph.has_node(activator):
                 inferred_type = self._infer_type(activator)
                 self.graph.add_node(
@@ -376,21 +424,18 @@ class KnowledgeGraphBuilder:
                 self.graph.nodes[activator]["signal_role"] = "upstream"
 
             if not self.graph.has_edge(activator, seed_gene):
-                is_inhibitor = (
-                    "inhibit" in rel_label.lower() or "repress" in rel_label.lower()
-                )
                 self.graph.add_edge(
                     activator,
                     seed_gene,
                     weight=0.8,
                     relation=rel_label,
                     label=rel_label,
-                    color="#ef4444" if is_inhibitor else "#22c55e",
+                    color=edge_color,
                     source="curated",
                     signal_direction="upstream",
                 )
 
-        for effector, rel_label in sig.get("downstream", []):
+        for effector, rel_label, edge_color in downstream:
             if not self.graph.has_node(effector):
                 inferred_type = self._infer_type(effector)
                 self.graph.add_node(
@@ -407,16 +452,13 @@ class KnowledgeGraphBuilder:
                 self.graph.nodes[effector]["signal_role"] = "downstream"
 
             if not self.graph.has_edge(seed_gene, effector):
-                is_inhibitor = (
-                    "inhibit" in rel_label.lower() or "repress" in rel_label.lower()
-                )
                 self.graph.add_edge(
                     seed_gene,
                     effector,
                     weight=0.8,
                     relation=rel_label,
                     label=rel_label,
-                    color="#ef4444" if is_inhibitor else "#22c55e",
+                    color=edge_color,
                     source="curated",
                     signal_direction="downstream",
                 )
@@ -437,19 +479,22 @@ class KnowledgeGraphBuilder:
     ) -> Dict[str, Tuple[float, float]]:
         """
         Compute spring layout positions and return as {node_id: (x, y)}.
-        Caches result based on graph fingerprint to avoid recomputation.
+        Caches results keyed on the graph's node and edge sets, so attribute-only
+        updates reuse the layout while any structural change recomputes it.
         """
         if self.graph.number_of_nodes() == 0:
             return {}
 
         cache_key = (
-            self.graph.number_of_nodes(),
-            self.graph.number_of_edges(),
+            frozenset(self.graph.nodes),
+            frozenset(self.graph.edges),
             width,
             height,
+            padding,
         )
-        if hasattr(self, "_layout_cache") and self._layout_cache_key == cache_key:
-            return self._layout_cache
+        cached = self._layout_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         pos = nx.spring_layout(
             self.graph,
@@ -471,8 +516,9 @@ class KnowledgeGraphBuilder:
             sy = padding + ((y - y_min) / y_range) * (height - 2 * padding)
             scaled[nid] = (round(sx, 1), round(sy, 1))
 
-        self._layout_cache = scaled
-        self._layout_cache_key = cache_key
+        if len(self._layout_cache) >= LAYOUT_CACHE_MAX_SIZE:
+            self._layout_cache.pop(next(iter(self._layout_cache)))
+        self._layout_cache[cache_key] = scaled
 
         return scaled
 
@@ -6,7 +6,9 @@ from typing import List, Literal, Optional, Dict, Any
 import asyncio
 import json
 import logging
+import re
 import time
+from collections import defaultdict
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +20,11 @@ from .ttt import (
     NeuroSymbolicLoop,
 )
 from .constants import (
+    DEFAULT_HTTP_TIMEOUT,
+    HTTP_CONNECT_TIMEOUT,
+    HTTP_KEEPALIVE_EXPIRY,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_KEEPALIVE_CONNECTIONS,
     ACTIVATION_GLOW_THRESHOLD,
     ACTIVATION_RADIUS_BOOST,
     DEFAULT_NODE_RADIUS,
@@ -45,6 +52,7 @@ from .validation import ValidationAgent
 from .orchestrator import AgentOrchestrator
 from .entity_extraction import get_extractor
 from .clinical_trials import ClinicalTrialsClient
+from .kg_builder import intern_id
 from .schemas import (
     HypothesisObject, 
     ValidationScorecard, 
@@ -57,13 +65,29 @@ import httpx
 import os
 from contextlib import asynccontextmanager
 
-shared_client = httpx.AsyncClient(timeout=60.0)
+# One pooled HTTP/2 client for every agent; sized for the /dossier and validation fan-out
+# (pool limits and HTTP/2 live on the transport; httpx ignores the client-level ones when a transport is given)
+shared_client = httpx.AsyncClient(
+    timeout=httpx.Timeout(DEFAULT_HTTP_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT),
+    transport=httpx.AsyncHTTPTransport(
+        http2=True,
+        retries=2,
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+        ),
+    ),
+)
 
 
 @asynccontextmanager
 async def lifespan(app_instance):
-    """Startup/shutdown lifecycle — properly close all persistent HTTP clients."""
+    """Startup/shutdown lifecycle — warm upstream connections, then close all persistent HTTP clients."""
+    # Pre-resolve DNS and fill the pool in the background so startup is not delayed by a slow host
+    warmup = asyncio.create_task(validation_agent.warm_connections())
     yield
+    warmup.cancel()
     await shared_client.aclose()
     await ot_client.client.aclose()
     await lit_agent.client.aclose()
@@ -132,7 +156,8 @@ structure_agent = StructureAgent(client=shared_client)
 patent_agent = PatentAgent(client=shared_client)
 model_agent = ModelAgent(client=shared_client)
 protocol_agent = ProtocolAgent(client=shared_client)
-ct_client = ClinicalTrialsClient(client=shared_client)
+# Persistent trial cache is opt-in: set CT_CACHE_DIR to enable it
+ct_client = ClinicalTrialsClient(client=shared_client, cache_dir=os.getenv("CT_CACHE_DIR"))
 validation_agent = ValidationAgent(client=shared_client, ct_client=ct_client)
 entity_extractor = get_extractor()
 
@@ -240,13 +265,26 @@ TISSUE_MAP = [
 ]
 
 
+# keyword -> (TISSUE_MAP rank, tissue); earlier TISSUE_MAP rows win when several keywords appear
+_TISSUE_KEYWORDS = {
+    kw: (rank, tissue)
+    for rank, (keywords, tissue) in enumerate(TISSUE_MAP)
+    for kw in keywords
+}
+# One compiled pass over the query; the lookahead reports overlapping hits, matching `kw in q` semantics
+_TISSUE_RE = re.compile(
+    "(?=("
+    + "|".join(re.escape(kw) for kw in sorted(_TISSUE_KEYWORDS, key=len, reverse=True))
+    + "))"
+)
+
+
 def _infer_tissue(query_text: str) -> str:
     """Infer tissue type from query text. Returns 'lung' as default."""
-    q = query_text.lower()
-    for keywords, tissue in TISSUE_MAP:
-        if any(kw in q for kw in keywords):
-            return tissue
-    return "lung"
+    hits = _TISSUE_RE.findall(query_text.lower())
+    if not hits:
+        return "lung"
+    return min(_TISSUE_KEYWORDS[kw] for kw in hits)[1]
 
 
 # --- Shared Helpers ---
@@ -254,12 +292,16 @@ def _infer_tissue(query_text: str) -> str:
 
 def _build_adjacency(links: List[Dict]) -> Dict[str, List[Dict]]:
     """Pre-index links into a source→[link] adjacency map for O(1) lookups."""
-    adj: Dict[str, List[Dict]] = {}
+    adj: Dict[str, List[Dict]] = defaultdict(list)
+    bucket = adj.__getitem__  # local bind: one call per edge end instead of setdefault + list alloc
     for link in links:
-        src = link.get("source", "")
-        tgt = link.get("target", "")
-        adj.setdefault(src, []).append(link)
-        adj.setdefault(tgt, []).append(link)
+        get = link.get
+        src, tgt = intern_id(get("source", "")), intern_id(get("target", ""))
+        bucket(src).append(link)
+        if tgt != src:  # self-loops are indexed once, matching a scan over links
+            bucket(tgt).append(link)
+    # Behave like a plain dict for callers: missing nodes must not be inserted on lookup
+    adj.default_factory = None
     return adj
 
 
@@ -274,7 +316,8 @@ def _collect_evidence(
 ) -> List[Dict[str, Any]]:
     """Build evidence trail: edges connecting node_id to any node in partner_pool."""
     partner_map = {p.get("id"): p for p in partner_pool}
-    relevant_links = adj.get(node_id, []) if adj else links
+    # An empty adjacency map still means "no edges", not "scan everything"
+    relevant_links = adj.get(node_id, ()) if adj is not None else links
     items: List[Dict[str, Any]] = []
     for link in relevant_links:
         src, tgt = link.get("source"), link.get("target")
@@ -386,24 +429,22 @@ def _generate_hypotheses(
         reverse=True,
     )
 
+    # id -> node lookups so partner resolution is a dict hit, not a scan per link
+    gene_by_id = {n.get("id"): n for n in genes}
+    disease_by_id = {n.get("id"): n for n in diseases}
+
     hypotheses: List[Hypothesis] = []
     h_idx = 0
 
     # --- Strategy 1: Gene-Disease association hypotheses ---
     for gene in genes[:2]:
+        gene_id = gene.get("id")
         gene_name = gene.get("label") or gene.get("id", "Unknown")
         # Find diseases linked to this gene
         linked_diseases = []
-        for link in links:
-            partner = None
-            if link.get("source") == gene.get("id"):
-                partner = next(
-                    (n for n in diseases if n.get("id") == link.get("target")), None
-                )
-            elif link.get("target") == gene.get("id"):
-                partner = next(
-                    (n for n in diseases if n.get("id") == link.get("source")), None
-                )
+        for link in adj.get(gene_id, ()):
+            src = link.get("source")
+            partner = disease_by_id.get(link.get("target") if src == gene_id else src)
             if partner:
                 linked_diseases.append(
                     (partner.get("label") or partner.get("id"), link.get("weight", 0.5))
@@ -431,23 +472,16 @@ def _generate_hypotheses(
 
     # --- Strategy 2: Drug-Gene targeting hypotheses ---
     for drug in drugs[:2]:
+        drug_id = drug.get("id")
         drug_name = drug.get("label") or drug.get("id", "Unknown")
         targets = []
-        for link in links:
+        for link in adj.get(drug_id, ()):
             relation = (link.get("relation") or "").lower()
             if "target" in relation or "inhibit" in relation:
-                if link.get("source") == drug.get("id"):
-                    t = next(
-                        (n for n in genes if n.get("id") == link.get("target")), None
-                    )
-                    if t:
-                        targets.append(t.get("label") or t.get("id"))
-                elif link.get("target") == drug.get("id"):
-                    t = next(
-                        (n for n in genes if n.get("id") == link.get("source")), None
-                    )
-                    if t:
-                        targets.append(t.get("label") or t.get("id"))
+                src = link.get("source")
+                t = gene_by_id.get(link.get("target") if src == drug_id else src)
+                if t:
+                    targets.append(t.get("label") or t.get("id"))
 
         if targets:
             h_idx += 1
@@ -495,18 +529,14 @@ def _generate_hypotheses(
 
     # --- Strategy 4: Pathway involvement ---
     for pw in pathways[:1]:
+        pw_id = pw.get("id")
         pw_name = pw.get("label") or pw.get("id", "Unknown")
         linked_genes_in_pw = []
-        for link in links:
-            if link.get("source") == pw.get("id") or link.get("target") == pw.get("id"):
-                partner_id = (
-                    link.get("target")
-                    if link.get("source") == pw.get("id")
-                    else link.get("source")
-                )
-                partner = next((n for n in genes if n.get("id") == partner_id), None)
-                if partner:
-                    linked_genes_in_pw.append(partner.get("label") or partner.get("id"))
+        for link in adj.get(pw_id, ()):
+            src = link.get("source")
+            partner = gene_by_id.get(link.get("target") if src == pw_id else src)
+            if partner:
+                linked_genes_in_pw.append(partner.get("label") or partner.get("id"))
         if linked_genes_in_pw:
             h_idx += 1
             evidence_items = _collect_evidence(
@@ -1308,39 +1338,48 @@ async def generate_stream(query: Query):
             }
         )
 
-        # Run KG build
+        # Literature search and atlas fetch don't depend on the KG, so start them now
+        # and let them overlap with the KG build instead of waiting for it.
+        side_results = asyncio.gather(
+            lit_agent.search_papers(query.text, limit=6),
+            asyncio.to_thread(atlas_agent.fetch_tumor_atlas, tissue_type, 300),
+            return_exceptions=True,
+        )
+
+        # If the client disconnects before the side results are awaited, the generator is
+        # closed here; cancel the gather so the paper search and atlas fetch stop with it.
         try:
-            kg_result = await req_graph.build_from_query(query.text)
-            subgraph_data = req_graph.get_subgraph_data()
+            # Run KG build
+            try:
+                kg_result = await req_graph.build_from_query(query.text)
+                subgraph_data = req_graph.get_subgraph_data()
+                yield _sse(
+                    {
+                        "type": "kg_complete",
+                        "message": "Knowledge graph built",
+                        "progress": 0.4,
+                        "data": {
+                            "node_count": len(subgraph_data.get("nodes", [])),
+                            "edge_count": len(subgraph_data.get("links", [])),
+                        },
+                    }
+                )
+            except Exception as e:
+                yield _sse({"type": "error", "step": "kg", "message": str(e)})
+                subgraph_data = {"nodes": [], "links": []}
+
             yield _sse(
                 {
-                    "type": "kg_complete",
-                    "message": "Knowledge graph built",
-                    "progress": 0.4,
-                    "data": {
-                        "node_count": len(subgraph_data.get("nodes", [])),
-                        "edge_count": len(subgraph_data.get("links", [])),
-                    },
+                    "type": "status",
+                    "message": "Searching literature & atlas...",
+                    "progress": 0.5,
                 }
             )
-        except Exception as e:
-            yield _sse({"type": "error", "step": "kg", "message": str(e)})
-            subgraph_data = {"nodes": [], "links": []}
 
-        # Run lit search in parallel with atlas
-        yield _sse(
-            {
-                "type": "status",
-                "message": "Searching literature & atlas...",
-                "progress": 0.5,
-            }
-        )
-
-        papers_result, atlas_result = await asyncio.gather(
-            lit_agent.search_papers(query.text, limit=6),
-            asyncio.to_thread(atlas_agent.fetch_tumor_atlas, tissue_type, 300),
-            return_exceptions=True,
-        )
+            papers_result, atlas_result = await side_results
+        finally:
+            if not side_results.done():
+                side_results.cancel()
 
         papers = papers_result if not isinstance(papers_result, BaseException) else []
         atlas_data = (
@@ -13,7 +13,11 @@ import logging
 import re
 import threading
 import uuid
-from .constants import SEMANTIC_CACHE_MAX_SIZE, SEMANTIC_SIMILARITY_THRESHOLD
+from .constants import (
+    SEMANTIC_CACHE_MAX_SIZE,
+    SEMANTIC_FUZZY_MEMO_SIZE,
+    SEMANTIC_SIMILARITY_THRESHOLD,
+)
 from typing import Dict, List, Any, Optional, Callable, Awaitable, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
@@ -28,6 +32,8 @@ from .schemas import (
 )
 from .mast_monitor import MASTMonitor
 import anthropic
+from rapidfuzz import process
+from rapidfuzz.distance import Indel
 
 # Tool definitions for Claude
 TOOLS = [
@@ -159,18 +165,36 @@ class SemanticCache:
         self.hits = 0
         self.misses = 0
         self._lock = threading.Lock()
+        # (tool, query tokens) -> cache key of its last fuzzy match; cleared whenever a new entry could outrank it
+        self._fuzzy_memo: OrderedDict[Tuple[str, Tuple[str, ...]], str] = OrderedDict()
+        # tool -> {cache key: fuzzy tokens}, so fuzzy lookups only score that tool's entries
+        self._keys_for_tool: Dict[str, Dict[str, Tuple[str, ...]]] = {}
 
     def _normalize_key(self, tool: str, params: Dict) -> str:
         sorted_params = json.dumps(params, sort_keys=True).lower()
         return f"{tool}:{hashlib.sha256(sorted_params.encode()).hexdigest()}"
 
-    def _extract_keywords(self, params: Dict) -> set:
-        keywords = set()
-        for v in params.values():
-            if isinstance(v, str):
-                words = v.lower().replace("-", " ").replace("_", " ").split()
-                keywords.update(words)
-        return keywords
+    def _fuzzy_tokens(self, params: Dict) -> Tuple[str, ...]:
+        """Sorted, de-duplicated "param:word" tokens; words only ever match within the same param."""
+        return tuple(sorted({
+            f"{name}:{word}"
+            for name, v in params.items()
+            if isinstance(v, str)
+            for word in v.lower().replace("-", " ").replace("_", " ").split()
+        }))
+
+    def _drop(self, key: str):
+        """Remove KEY from the cache and its tool index (caller holds the lock)."""
+        del self.cache[key]
+        self._unindex(key)
+
+    def _unindex(self, key: str):
+        tool = key.rsplit(":", 1)[0]
+        keys = self._keys_for_tool.get(tool)
+        if keys is not None:
+            keys.pop(key, None)
+            if not keys:
+                del self._keys_for_tool[tool]
 
     def get(self, tool: str, params: Dict, fuzzy: bool = True) -> Optional[Any]:
         with self._lock:
@@ -182,24 +206,33 @@ class SemanticCache:
                     self.hits += 1
                     return entry.data
                 else:
-                    del self.cache[key]
+                    self._drop(key)
             if fuzzy:
-                query_keywords = self._extract_keywords(params)
-                best_match, best_score = None, 0
-                for cached_key, entry in self.cache.items():
-                    if entry.is_expired or not cached_key.startswith(f"{tool}:"):
-                        continue
-                    cached_keywords = self._extract_keywords(entry.data.get("_params", {}))
-                    if not cached_keywords: continue
-                    intersection = len(query_keywords & cached_keywords)
-                    union = len(query_keywords | cached_keywords)
-                    score = intersection / union if union > 0 else 0
-                    if score > SEMANTIC_SIMILARITY_THRESHOLD and score > best_score:
-                        best_score = score
-                        best_match = entry.data
-                if best_match:
+                query_tokens = self._fuzzy_tokens(params)
+                memo_key = (tool, query_tokens)
+                matched_key = self._fuzzy_memo.get(memo_key)
+                if matched_key is not None:
+                    entry = self.cache.get(matched_key)
+                    if entry is not None and not entry.is_expired:
+                        self._fuzzy_memo.move_to_end(memo_key)
+                        self.hits += 1
+                        return entry.data
+                    del self._fuzzy_memo[memo_key]
+                tool_keys = self._keys_for_tool.get(tool, {})
+                expired = [k for k in tool_keys if self.cache[k].is_expired]
+                for k in expired:
+                    self._drop(k)
+                # Indel similarity over sorted unique tokens is the Dice coefficient, so words missing on
+                # either side count against the match: "KRAS lung" hits "KRAS lung cancer" (0.8) but
+                # "EGFR lung cancer" (0.67) and "lung" (0.5) do not. The cutoff is applied here rather than
+                # via score_cutoff, which rejects scores landing exactly on the threshold.
+                match = process.extractOne(query_tokens, tool_keys, scorer=Indel.normalized_similarity)
+                if match and match[1] >= SEMANTIC_SIMILARITY_THRESHOLD:
+                    self._fuzzy_memo[memo_key] = match[2]
+                    if len(self._fuzzy_memo) > SEMANTIC_FUZZY_MEMO_SIZE:
+                        self._fuzzy_memo.popitem(last=False)
                     self.hits += 1
-                    return best_match
+                    return self.cache[match[2]].data
             self.misses += 1
             return None
 
@@ -208,9 +241,16 @@ class SemanticCache:
             key = self._normalize_key(tool, params)
             data_with_meta = data.copy() if isinstance(data, dict) else {"_data": data}
             data_with_meta["_params"] = params
+            fuzzy_tokens = self._fuzzy_tokens(params)
+            self._fuzzy_memo.clear()
             self.cache[key] = CacheEntry(data=data_with_meta, timestamp=datetime.now(), ttl_seconds=ttl)
+            if fuzzy_tokens:
+                self._keys_for_tool.setdefault(tool, {})[key] = fuzzy_tokens
+            else:
+                self._unindex(key)
             while len(self.cache) > self.max_size:
-                self.cache.popitem(last=False)
+                evicted_key, _ = self.cache.popitem(last=False)
+                self._unindex(evicted_key)
 
     def stats(self) -> Dict:
         total = self.hits + self.misses
@@ -1,11 +1,16 @@
+import asyncio
 import httpx
 import logging
+import orjson
 import os
 import re
 import hashlib
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
+from .constants import LLM_MAX_CONCURRENCY
+from .http_utils import request_with_retry
+
 logger = logging.getLogger(__name__)
 
 
@@ -36,6 +41,12 @@ class ProtocolAgent:
         self._owns_client = client is None
         self.openai_key = os.getenv("OPENAI_API_KEY")
         self.anthropic_key = os.getenv("ANTHROPIC_API_KEY")
+        # LLM calls in flight keyed by prompt hash, so identical concurrent prompts are billed once
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # Caps concurrent provider calls so bursts queue here instead of tripping rate limits
+        self._llm_sem = asyncio.Semaphore(
+            int(os.getenv("LLM_MAX_CONCURRENCY", LLM_MAX_CONCURRENCY))
+        )
 
         # gRNA scoring parameters (based on Doench et al. 2016 - Rule Set 2)
         self.position_weights = {
@@ -407,38 +418,49 @@ Include:
 Format as clean markdown suitable for a lab notebook."""
 
         if self.openai_key:
-            return await self._call_openai(prompt)
+            call = self._call_openai
         elif self.anthropic_key:
-            return await self._call_anthropic(prompt)
+            call = self._call_anthropic
+        else:
+            return None
 
-        return None
+        key = hashlib.sha256(prompt.encode()).hexdigest()
+        fut = self._inflight.get(key)
+        if fut is None:
+            fut = asyncio.ensure_future(call(prompt))
+            self._inflight[key] = fut
+            fut.add_done_callback(lambda _f: self._inflight.pop(key, None))
+        return await asyncio.shield(fut)
 
     async def _call_openai(self, prompt: str) -> str:
         """Call OpenAI API."""
 
         try:
-            resp = await self.client.post(
-                "https://api.openai.com/v1/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {self.openai_key}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "model": "gpt-4o-mini",
-                    "messages": [
-                        {
-                            "role": "system",
-                            "content": "You are an expert molecular biologist writing detailed lab protocols.",
-                        },
-                        {"role": "user", "content": prompt},
-                    ],
-                    "temperature": 0.3,
-                    "max_tokens": 2000,
-                },
-            )
+            async with self._llm_sem:
+                resp = await request_with_retry(
+                    self.client,
+                    "POST",
+                    "https://api.openai.com/v1/chat/completions",
+                    headers={
+                        "Authorization": f"Bearer {self.openai_key}",
+                        "Content-Type": "application/json",
+                    },
+                    json={
+                        "model": "gpt-4o-mini",
+                        "messages": [
+                            {
+                                "role": "system",
+                                "content": "You are an expert molecular biologist writing detailed lab protocols.",
+                            },
+                            {"role": "user", "content": prompt},
+                        ],
+                        "temperature": 0.3,
+                        "max_tokens": 2000,
+                    },
+                )
 
             if resp.status_code == 200:
-                return resp.json()["choices"][0]["message"]["content"]
+                return orjson.loads(resp.content)["choices"][0]["message"]["content"]
 
         except Exception as e:
             logger.error("OpenAI API error: %s", e)
@@ -451,11 +473,12 @@ Format as clean markdown suitable for a lab notebook."""
             import anthropic
 
             client = anthropic.AsyncAnthropic(api_key=self.anthropic_key)
-            response = await client.messages.create(
-                model="claude-3-haiku-20240307",
-                max_tokens=2000,
-                messages=[{"role": "user", "content": prompt}],
-            )
+            async with self._llm_sem:
+                response = await client.messages.create(
+                    model="claude-3-haiku-20240307",
+                    max_tokens=2000,
+                    messages=[{"role": "user", "content": prompt}],
+                )
             return response.content[0].text
 
         except Exception as e:
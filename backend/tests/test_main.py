@@ -22,19 +22,24 @@ from fastapi.testclient import TestClient
 # App fixture
 # ---------------------------------------------------------------------------
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client():
-    """Sync test client for simple endpoint tests."""
+    """Sync test client for simple endpoint tests, shared across the session (stateless; tests patch per-call)."""
     from app.main import app
     return TestClient(app)
 
 
-@pytest.fixture
-async def async_client():
-    """Async test client for async endpoint tests."""
+@pytest.fixture(scope="session")
+def asgi_transport():
+    """ASGI transport bound to the app, built once and shared by async clients."""
     from app.main import app
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+    return ASGITransport(app=app)
+
+
+@pytest.fixture
+async def async_client(asgi_transport):
+    """Async test client for async endpoint tests (per-test client, shared transport)."""
+    async with AsyncClient(transport=asgi_transport, base_url="http://test") as ac:
         yield ac
 
 
@@ -129,6 +134,13 @@ class TestHelpers:
         from app.main import _build_adjacency
         assert _build_adjacency([]) == {}
 
+    def test_build_adjacency_lookup_does_not_insert(self):
+        from app.main import _build_adjacency
+        adj = _build_adjacency([{"source": "A", "target": "B"}])
+        with pytest.raises(KeyError):
+            adj["missing"]
+        assert set(adj) == {"A", "B"}
+
     def test_collect_evidence(self):
         from app.main import _collect_evidence
         links = [
@@ -154,6 +166,21 @@ class TestHelpers:
         evidence = _collect_evidence("A", "A", links, partners, adj=adj)
         assert len(evidence) == 1
 
+    def test_collect_evidence_empty_adj_skips_scan(self):
+        from app.main import _collect_evidence
+        links = [{"source": "A", "target": "B", "relation": "r1", "weight": 0.9}]
+        partners = [{"id": "B", "label": "B"}]
+        assert _collect_evidence("A", "A", links, partners, adj={}) == []
+
+    def test_collect_evidence_self_loop_matches_scan(self):
+        from app.main import _collect_evidence, _build_adjacency
+        links = [{"source": "A", "target": "A", "relation": "autoregulates", "weight": 0.7}]
+        partners = [{"id": "A", "label": "A"}]
+        scanned = _collect_evidence("A", "A", links, partners)
+        indexed = _collect_evidence("A", "A", links, partners, adj=_build_adjacency(links))
+        assert indexed == scanned
+        assert len(indexed) == 1
+
     def test_inject_activations(self):
         from app.main import _inject_activations
         nodes = [
@@ -176,6 +203,12 @@ class TestHelpers:
         from app.main import _infer_tissue
         assert _infer_tissue("PANCREATIC adenocarcinoma") == "pancreas"
 
+    def test_infer_tissue_keeps_map_priority(self):
+        from app.main import _infer_tissue
+        # melanoma precedes brain in TISSUE_MAP even though "brain" appears first
+        assert _infer_tissue("brain metastases from melanoma") == "skin"
+        assert _infer_tissue("Glioblastoma stem cells") == "brain"
+
 
 # ---------------------------------------------------------------------------
 # Knowledge Graph Builder tests
@@ -237,6 +270,21 @@ class TestKnowledgeGraphBuilder:
         pos2 = builder.compute_layout()
         assert pos1 is pos2
 
+    def test_layout_recomputed_when_structure_changes(self):
+        from app.kg_builder import KnowledgeGraphBuilder
+        builder = KnowledgeGraphBuilder()
+        builder.add_entities({"gene": ["A", "B", "C"]})
+        builder.add_relations({"associated_with": [("A", "B")]})
+        pos1 = builder.compute_layout()
+        # Same node/edge counts, different edge: the old count-based key returned a stale layout
+        builder.graph.remove_edge("A", "B")
+        builder.graph.add_edge("B", "C")
+        pos2 = builder.compute_layout()
+        assert pos2 is not pos1
+        # Attribute-only updates keep the cached layout
+        builder.graph.nodes["A"]["confidence"] = 0.1
+        assert builder.compute_layout() is pos2
+
     def test_pathway_enrichment(self):
         from app.kg_builder import KnowledgeGraphBuilder
         builder = KnowledgeGraphBuilder()
@@ -251,6 +299,21 @@ class TestKnowledgeGraphBuilder:
         assert entity_text({"text": "BRAF"}) == "BRAF"
         assert entity_text(42) == "42"
 
+    def test_node_ids_are_interned(self):
+        import sys
+        from app.kg_builder import KnowledgeGraphBuilder
+        builder = KnowledgeGraphBuilder()
+        gene = "".join(["KR", "AS"])  # built at runtime, so not interned
+        builder.add_entities({"gene": [gene]})
+        (node_id,) = builder.graph.nodes
+        assert node_id is sys.intern("KRAS")
+
+    def test_entity_text_fallbacks(self):
+        from collections import OrderedDict
+        from app.kg_builder import entity_text
+        assert entity_text({"label": "gene"}) == str({"label": "gene"})
+        assert entity_text(OrderedDict(text="TP53")) == "TP53"
+
     def test_infer_type(self):
         from app.kg_builder import KnowledgeGraphBuilder
         assert KnowledgeGraphBuilder._infer_type("KRAS") == "gene"
@@ -297,6 +360,25 @@ class TestExtractionCache:
         time.sleep(0.01)
         assert cache.get("x", "e") is None
 
+    def test_expired_entries_purged_on_write(self):
+        from app.entity_extraction import ExtractionCache
+        cache = ExtractionCache(max_size=10)
+        with patch("app.entity_extraction.time.time", return_value=1000.0):
+            cache.set("old", "e", {"v": 1})
+        with patch("app.entity_extraction.time.time", return_value=1000.0 + 3600):
+            cache.set("new", "e", {"v": 2})
+        assert list(cache.cache) == [cache._make_key("new", "e")]
+        assert len(cache._expiry_heap) == 1
+
+    def test_expiry_heap_bounded_under_repeated_sets(self):
+        from app.entity_extraction import ExtractionCache
+        cache = ExtractionCache(max_size=10)
+        for i in range(5000):
+            cache.set(f"k{i % 20}", "e", {"v": i})
+        assert len(cache.cache) == 10
+        assert len(cache._expiry_heap) <= 2 * cache.max_size
+        assert set(cache.cache) <= {k for _, k in cache._expiry_heap}
+
     def test_stats(self):
         from app.entity_extraction import ExtractionCache
         cache = ExtractionCache(max_size=10)
@@ -328,6 +410,42 @@ class TestSemanticCache:
         result = cache.get("search_literature", {"query": "KRAS lung"}, fuzzy=True)
         assert result is not None
 
+    def test_fuzzy_rejects_unrelated_query(self):
+        from app.orchestrator import SemanticCache
+        cache = SemanticCache(max_size=10)
+        cache.set("search_literature", {"query": "KRAS lung cancer"}, {"papers": []})
+        assert cache.get("search_literature", {"query": "EGFR breast"}, fuzzy=True) is None
+
+    @pytest.mark.parametrize("query", [
+        {"query": "EGFR lung cancer"},
+        {"query": "KRAS colorectal cancer"},
+        {"query": "cancer"},
+        {"query": "lung"},
+    ])
+    def test_fuzzy_rejects_partial_word_overlap(self, query):
+        from app.orchestrator import SemanticCache
+        cache = SemanticCache(max_size=10)
+        cache.set("search_literature", {"query": "KRAS lung cancer"}, {"papers": []})
+        assert cache.get("search_literature", query, fuzzy=True) is None
+
+    def test_fuzzy_rejects_different_gene_param(self):
+        from app.orchestrator import SemanticCache
+        cache = SemanticCache(max_size=10)
+        cache.set("query_knowledge_graph", {"gene": "KRAS", "disease": "lung cancer"}, {"nodes": []})
+        assert cache.get("query_knowledge_graph", {"gene": "EGFR", "disease": "lung cancer"}) is None
+        assert cache.get("query_knowledge_graph", {"gene": "kras", "disease": "Lung-Cancer"}) is not None
+
+    def test_fuzzy_match_memoised_until_next_set(self):
+        from app.orchestrator import SemanticCache
+        cache = SemanticCache(max_size=10)
+        cache.set("search_literature", {"query": "KRAS lung cancer"}, {"papers": [1]})
+        assert cache.get("search_literature", {"query": "KRAS lung"})["papers"] == [1]
+        with patch("app.orchestrator.process.extractOne") as extract:
+            assert cache.get("search_literature", {"query": "KRAS lung"})["papers"] == [1]
+        extract.assert_not_called()
+        cache.set("search_literature", {"query": "KRAS lung"}, {"papers": [2]})
+        assert cache._fuzzy_memo == {}
+
     def test_no_cross_tool_fuzzy(self):
         from app.orchestrator import SemanticCache
         cache = SemanticCache(max_size=10)
@@ -343,6 +461,18 @@ class TestSemanticCache:
         cache.set("t", {"q": "c"}, {"v": 3})
         assert cache.stats()["size"] == 2
 
+    def test_tool_index_tracks_eviction_and_expiry(self):
+        from app.orchestrator import SemanticCache
+        cache = SemanticCache(max_size=2)
+        cache.set("t", {"q": "alpha"}, {"v": 1})
+        cache.set("u", {"q": "beta"}, {"v": 2}, ttl=-1)
+        cache.set("t", {"q": "gamma"}, {"v": 3})
+        assert set(cache._keys_for_tool) == {"t", "u"}
+        assert list(cache._keys_for_tool["t"].values()) == [("q:gamma",)]
+        assert cache.get("u", {"q": "beta gamma"}) is None
+        assert "u" not in cache._keys_for_tool
+        assert cache.stats()["size"] == 1
+
 
 # ---------------------------------------------------------------------------
 # External data file tests
@@ -486,6 +616,31 @@ class TestHypothesisGeneration:
         result = _generate_hypotheses({"nodes": nodes, "links": links}, "test")
         assert len(result) <= MAX_HYPOTHESES
 
+    async def test_stream_disconnect_cancels_side_searches(self):
+        import asyncio
+        from app import main
+        started, cancelled = asyncio.Event(), asyncio.Event()
+
+        async def slow_search(*args, **kwargs):
+            started.set()
+            try:
+                await asyncio.sleep(3600)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with patch.object(main.lit_agent, "search_papers", new=slow_search), \
+                patch.object(main.atlas_agent, "fetch_tumor_atlas", return_value={"cells": []}), \
+                patch("app.main.OncoGraph.build_from_query", new=AsyncMock(return_value={})), \
+                patch("app.main.OncoGraph.get_subgraph_data", return_value={"nodes": [], "links": []}):
+            response = await main.generate_stream(main.Query(text="KRAS lung cancer"))
+            events = response.body_iterator
+            await events.__anext__()  # status
+            await events.__anext__()  # kg_complete, side searches in flight
+            await started.wait()
+            await events.aclose()
+            await asyncio.wait_for(cancelled.wait(), timeout=1)
+
 
 # ---------------------------------------------------------------------------
 # Validation agent fallback tests
@@ -542,3 +697,355 @@ class TestValidationFallbacks:
         )
         assert "text" in result
         assert len(result["text"]) > 10
+
+
+# ---------------------------------------------------------------------------
+# Validation agent helper tests
+# ---------------------------------------------------------------------------
+
+class TestValidationHelpers:
+    def test_vital_tissue_expression_matches_subsites(self):
+        from app.validation import ValidationAgent
+        agent = ValidationAgent()
+        data = [
+            {"tissueSiteDetail": "Heart - Left Ventricle", "median": 12.5},
+            {"tissueSiteDetail": "Liver", "median": 3.0},
+            {"tissueSiteDetail": "Skin - Sun Exposed (Lower leg)", "median": 80.0},
+        ]
+        expr = agent._vital_tissue_expression(data)
+        assert expr == {"Heart - Left Ventricle": 12.5, "Liver": 3.0}
+
+    async def test_drugability_uses_opentargets_known_drugs(self):
+        import httpx
+        import respx
+        from app.validation import ValidationAgent
+        agent = ValidationAgent(client=httpx.AsyncClient())
+        payload = {"data": {"target": {"knownDrugs": {"rows": [
+            {"prefName": "SOTORASIB", "phase": 4},
+            {"prefName": "DIVARASIB", "phase": 1},
+        ]}}}}
+        with respx.mock:
+            route = respx.post(agent.opentargets_url).respond(json=payload)
+            result = await agent.check_drugability("KRAS")
+        assert route.called
+        assert result.status == "pass"
+        assert result.details["approved_drugs"] == ["SOTORASIB"]
+        assert result.details["source"] == "opentargets"
+
+    async def test_drugability_unmapped_gene_skips_network(self):
+        import respx
+        from app.validation import ValidationAgent
+        agent = ValidationAgent()
+        with respx.mock(assert_all_called=False) as mock:
+            result = await agent.check_drugability("ZZZZZ")
+        assert not mock.calls
+        assert result.status == "unknown"
+
+    def test_synthetic_lethality_surfaces_in_tractability(self):
+        from app.validation import ValidationAgent
+        sl = ValidationAgent._get_synthetic_lethality("parp1")
+        assert sl["partners"] == ("BRCA1", "BRCA2", "ATM", "PALB2")
+        assert ValidationAgent._get_synthetic_lethality("ZZZZZ") is None
+        with pytest.raises(TypeError):
+            sl["context"] = "corrupted"
+        check = ValidationAgent()._fallback_drugability("KRAS")
+        assert check.details["synthetic_lethality"]["partners"] == ["STK11", "KEAP1"]
+
+    @pytest.mark.parametrize("approved,clinical,preclinical,status,summary", [
+        (["a", "b", "c"], ["d"], [], "pass", "Approved: a, b"),
+        ([], ["d"], [], "pass", "In clinical trials: d"),
+        ([], [], ["e"], "caution", "Preclinical only"),
+        ([], [], [], "fail", "X is currently undrugged"),
+    ])
+    def test_tractability_tiers(self, approved, clinical, preclinical, status, summary):
+        from app.validation import ValidationAgent
+        check = ValidationAgent._tractability_check("X", approved, clinical, preclinical, source="curated")
+        assert check.status == status
+        assert check.summary == summary
+
+    def test_canon_resolves_aliases_to_curated_keys(self):
+        from app.validation import ValidationAgent, _canon
+        assert _canon(" her2 ") == "ERBB2"
+        assert _canon("ERBB2") == "ERBB2"
+        assert _canon("kras") == "KRAS"
+        assert ValidationAgent._get_synthetic_lethality("SHP2")["context"] == "RTK-RAS pathway dependency"
+        assert ValidationAgent()._fallback_drugability("HER2").status == "pass"
+        assert ValidationAgent._fallback_drugability_cached("ERBB2")[0][0] == "Trastuzumab"
+
+    async def test_curated_fallbacks_use_hoisted_tables(self):
+        from app.validation import ValidationAgent
+        agent = ValidationAgent()
+        ess = agent._fallback_essentiality("kras", "Lung")
+        assert ess.status == "pass"
+        assert ess.metrics[0].value == -1.2
+        surv = await agent.check_survival("KRAS", "Non-small cell LUNG cancer")
+        assert "luad_tcga" in surv.summary
+
+    def test_cached_essentiality_fallback_not_shared(self):
+        from app.validation import ValidationAgent
+        agent = ValidationAgent()
+        first = agent._fallback_essentiality("KRAS", "lung")
+        first.summary = "corrupted"
+        first.metrics.clear()
+        second = agent._fallback_essentiality("KRAS", "lung")
+        assert second is not first
+        assert second.summary == "KRAS dependency in lung from curated data."
+        assert second.metrics[0].value == -1.2
+
+    def test_cached_drugability_fallback_not_shared(self):
+        from app.validation import ValidationAgent
+        agent = ValidationAgent()
+        first = agent._fallback_drugability("EGFR")
+        first.details["approved_drugs"].append("Bogus")
+        first.summary = "corrupted"
+        second = agent._fallback_drugability("EGFR")
+        assert "Bogus" not in second.details["approved_drugs"]
+        assert second.summary.startswith("Approved")
+
+    async def test_validate_hypothesis_aggregates_checks(self):
+        from app.validation import ValidationAgent
+        from app.schemas import ValidationCheck, ValidationStatus
+        agent = ValidationAgent()
+
+        def _check(status, score):
+            return ValidationCheck(title="t", status=status, score=score, summary="s")
+
+        agent.check_essentiality = AsyncMock(return_value=_check(ValidationStatus.PASS, 90.0))
+        agent.check_survival = AsyncMock(return_value=_check(ValidationStatus.CAUTION, 60.0))
+        agent.check_toxicity = AsyncMock(side_effect=RuntimeError("GTEx down"))
+        agent.check_drugability = AsyncMock(return_value=_check(ValidationStatus.PASS, 70.0))
+        agent.check_competition = AsyncMock(return_value=_check(ValidationStatus.PASS, 80.0))
+
+        scorecard = await agent.validate_hypothesis("KRAS", "lung")
+        assert scorecard.overall_status == ValidationStatus.CAUTION
+        assert scorecard.overall_score == 70.0
+        assert scorecard.checks["toxicity"].status == ValidationStatus.UNKNOWN
+
+    async def test_grounded_rationale_skips_unknown_checks(self):
+        from app.validation import ValidationAgent
+        from app.schemas import ValidationCheck, ValidationMetric, ValidationStatus, FidelityLevel
+        checks = {
+            "essentiality": ValidationCheck(
+                title="Essentiality", status=ValidationStatus.PASS, score=80, summary="Essential",
+                metrics=[ValidationMetric(name="Score", value=-1.2, interpretation="", fidelity=FidelityLevel.L3_BIOLOGICAL_FIT)],
+            ),
+            "survival": ValidationAgent._error_check("Survival"),
+        }
+        result = await ValidationAgent().generate_grounded_rationale("KRAS", "lung", checks)
+        assert result["text"] == "Hypothesis for KRAS in lung: Essential (Score=-1.2)"
+        assert result["links"] == []
+
+    async def test_competition_counts_active_and_phase3_trials(self):
+        from app.validation import ValidationAgent
+        ct = MagicMock()
+        ct.cached_search.return_value = None
+        ct.search_trials_uncached = AsyncMock(return_value={"summary": {
+            "total_count": 4,
+            "by_status": {"Recruiting": 2, "Completed": 1, "Active, not recruiting": 1},
+            "by_phase": {"Phase 3": 1, "Phase 1": 3},
+        }})
+        check = await ValidationAgent(ct_client=ct).check_competition("KRAS", "lung")
+        assert check.status == "pass"
+        assert check.details == {"active_trials": 3, "phase3_trials": 1}
+
+    @pytest.mark.parametrize("count,status,score", [
+        (0, "pass", 80.0), (4, "pass", 80.0), (5, "caution", 55.0), (14, "caution", 55.0), (15, "fail", 30.0),
+    ])
+    async def test_competition_tiers(self, count, status, score):
+        from app.validation import ValidationAgent
+        ct = MagicMock()
+        ct.cached_search.return_value = {"summary": {"total_count": count}}
+        check = await ValidationAgent(ct_client=ct).check_competition("KRAS", "lung")
+        assert (check.status, check.score) == (status, score)
+
+    async def test_essentiality_summarises_depmap_scores(self):
+        import httpx
+        import respx
+        from app.validation import ValidationAgent
+        agent = ValidationAgent(client=httpx.AsyncClient())
+        payload = {
+            "target_lineage_scores": [-1.6, -1.2, -1.0, -0.6],
+            "other_lineage_scores": [-0.2, 0.0, 0.2],
+        }
+        with respx.mock:
+            respx.get(f"{agent.depmap_url}/genes/KRAS/dependencies").respond(json=payload)
+            result = await agent.check_essentiality("KRAS", "lung")
+        assert result.status == "pass"
+        assert result.details["cell_lines"] == 4
+        assert result.details["quartiles"] == [-1.3, -1.1, -0.9]
+        assert result.details["selectivity"] == -1.1
+
+    async def test_fetch_json_serves_stale_and_refreshes_once(self):
+        import asyncio
+        import httpx
+        import respx
+        from app.validation import ValidationAgent
+        from app.constants import VALIDATION_CACHE_FRESH_TTL
+        agent = ValidationAgent(client=httpx.AsyncClient())
+        url = "https://example.org/data"
+        with respx.mock:
+            route = respx.get(url).mock(side_effect=[
+                httpx.Response(200, json={"v": 1}),
+                httpx.Response(200, json={"v": 2}),
+            ])
+            assert await agent._fetch_json(url) == {"v": 1}
+            assert await agent._fetch_json(url) == {"v": 1}
+            assert route.call_count == 1
+
+            # Age the entry past the fresh window: stale value is served while one refresh runs
+            key, (fetched_at, payload) = next(iter(agent._response_cache.items()))
+            agent._response_cache[key] = (fetched_at - VALIDATION_CACHE_FRESH_TTL - 1, payload)
+            results = await asyncio.gather(agent._fetch_json(url), agent._fetch_json(url))
+            assert results == [{"v": 1}, {"v": 1}]
+            await asyncio.gather(*agent._refresh_tasks.values())
+            assert route.call_count == 2
+            assert await agent._fetch_json(url) == {"v": 2}
+
+    async def test_fetch_json_retries_transient_errors_only(self):
+        import httpx
+        import respx
+        from app.validation import ValidationAgent
+        agent = ValidationAgent(client=httpx.AsyncClient())
+        with respx.mock, patch("app.http_utils.asyncio.sleep", new=AsyncMock()) as sleep:
+            flaky = respx.get("https://example.org/flaky").mock(side_effect=[
+                httpx.Response(503),
+                httpx.Response(429),
+                httpx.Response(200, json={"ok": True}),
+            ])
+            missing = respx.get("https://example.org/missing").respond(404)
+            assert await agent._fetch_json("https://example.org/flaky") == {"ok": True}
+            assert await agent._fetch_json("https://example.org/missing") is None
+        assert flaky.call_count == 3
+        assert missing.call_count == 1
+        assert sleep.await_count == 2
+
+    async def test_fetch_json_coalesces_concurrent_misses(self):
+        import asyncio
+        import httpx
+        import respx
+        from app.validation import ValidationAgent
+        agent = ValidationAgent(client=httpx.AsyncClient())
+        with respx.mock:
+            route = respx.get("https://example.org/genes").respond(200, json={"n": 1})
+            results = await asyncio.gather(
+                *(agent._fetch_json("https://example.org/genes", params={"q": "KRAS"}) for _ in range(5))
+            )
+        assert results == [{"n": 1}] * 5
+        assert route.call_count == 1
+        assert agent._inflight == {}
+
+
+# ---------------------------------------------------------------------------
+# Clinical trials client tests
+# ---------------------------------------------------------------------------
+
+class TestClinicalTrialsClient:
+    async def test_search_trials_persists_live_results(self, tmp_path):
+        import httpx
+        import respx
+        from app.clinical_trials import CT_BASE_URL, ClinicalTrialsClient
+        study = {"protocolSection": {"identificationModule": {"nctId": "NCT00000001", "briefTitle": "T"}}}
+        with respx.mock:
+            route = respx.get(CT_BASE_URL).respond(200, json={"totalCount": 1, "studies": [study]})
+            first = await ClinicalTrialsClient(client=httpx.AsyncClient(), cache_dir=str(tmp_path)).search_trials("kras", "Lung")
+            # A fresh client over the same directory is served from disk
+            second = await ClinicalTrialsClient(client=httpx.AsyncClient(), cache_dir=str(tmp_path)).search_trials("KRAS", "lung")
+        assert route.call_count == 1
+        assert second["trials"] == first["trials"]
+        assert second["summary"]["total_count"] == 1
+
+    async def test_search_trials_coalesces_concurrent_queries(self):
+        import asyncio
+        import httpx
+        import respx
+        from app.clinical_trials import CT_BASE_URL, ClinicalTrialsClient
+        client = ClinicalTrialsClient(client=httpx.AsyncClient())
+        with respx.mock:
+            route = respx.get(CT_BASE_URL).respond(200, json={"totalCount": 0, "studies": []})
+            results = await asyncio.gather(*(client.search_trials("KRAS", "lung") for _ in range(3)))
+        assert route.call_count == 1
+        assert all(r["source"] == "live" for r in results)
+        assert client._inflight == {}
+
+    async def test_known_empty_query_skips_network(self):
+        import httpx
+        import respx
+        from app.clinical_trials import CT_BASE_URL, ClinicalTrialsClient
+        client = ClinicalTrialsClient(client=httpx.AsyncClient())
+        assert client.cached_search("ZZZZZ", "lung") is None
+        with respx.mock:
+            route = respx.get(CT_BASE_URL).respond(200, json={"totalCount": 0, "studies": []})
+            await client.search_trials("ZZZZZ", "lung")
+            again = await client.search_trials("zzzzz", "Lung")
+        assert route.call_count == 1
+        assert again["summary"]["total_count"] == 0
+        assert client.cached_search("ZZZZZ", "lung")["trials"] == []
+
+    async def test_competition_miss_reads_cache_once(self):
+        import httpx
+        import respx
+        from app.clinical_trials import CT_BASE_URL, ClinicalTrialsClient
+        from app.validation import ValidationAgent
+        client = ClinicalTrialsClient(client=httpx.AsyncClient())
+        agent = ValidationAgent(ct_client=client)
+        with respx.mock, patch.object(client, "_lookup", wraps=client._lookup) as lookup:
+            respx.get(CT_BASE_URL).respond(200, json={"totalCount": 0, "studies": []})
+            check = await agent.check_competition("KRAS", "lung")
+        assert check.status == "pass"
+        assert lookup.call_count == 1
+
+
+# ---------------------------------------------------------------------------
+# Protocol agent tests
+# ---------------------------------------------------------------------------
+
+class TestProtocolAgent:
+    async def test_openai_call_backs_off_on_rate_limit(self):
+        import httpx
+        import respx
+        from app.protocols import ProtocolAgent
+        agent = ProtocolAgent(client=httpx.AsyncClient())
+        agent.openai_key = "sk-test"
+        completion = {"choices": [{"message": {"content": "# Protocol"}}]}
+        with respx.mock, patch("app.http_utils.asyncio.sleep", new=AsyncMock()) as sleep:
+            route = respx.post("https://api.openai.com/v1/chat/completions").mock(side_effect=[
+                httpx.Response(429),
+                httpx.Response(200, json=completion),
+            ])
+            text = await agent._call_openai("prompt")
+        assert text == "# Protocol"
+        assert route.call_count == 2
+        assert sleep.await_count == 1
+        assert not agent._llm_sem.locked()
+
+
+# ---------------------------------------------------------------------------
+# Open Targets client tests
+# ---------------------------------------------------------------------------
+
+class TestOpenTargetsClient:
+    async def test_search_entity_returns_top_hit(self):
+        import json
+        import respx
+        from app.ark import OT_API_URL, OpenTargetsClient
+        # Trimmed from a live Open Targets search response for "KRAS"
+        payload = {"data": {"search": {"hits": [
+            {"id": "ENSG00000133703", "name": "KRAS", "entity": "target"},
+            {"id": "MONDO_0024513", "name": "KRAS-related disorder", "entity": "disease"},
+        ]}}}
+        client = OpenTargetsClient()
+        with respx.mock:
+            route = respx.post(OT_API_URL).respond(200, json=payload)
+            hit = await client.search_entity("KRAS")
+        await client.client.aclose()
+        assert hit == {"id": "ENSG00000133703", "name": "KRAS", "entity": "target"}
+        assert json.loads(route.calls.last.request.content)["variables"] == {"queryString": "KRAS"}
+
+    async def test_search_entity_no_hits(self):
+        import respx
+        from app.ark import OT_API_URL, OpenTargetsClient
+        client = OpenTargetsClient()
+        with respx.mock:
+            respx.post(OT_API_URL).respond(200, json={"data": {"search": {"hits": []}}})
+            assert await client.search_entity("ZZZZZ") is None
+        await client.client.aclose()